@@ -51,9 +51,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: VestaboardConfigEntry) -
 
 async def async_unload_entry(hass: HomeAssistant, entry: VestaboardConfigEntry) -> bool:
     """Unload a config entry."""
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
-    await entry.runtime_data.vestaboard.close()
-    return unload_ok
+    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
 
 async def update_listener(hass: HomeAssistant, entry: VestaboardConfigEntry) -> None:
@@ -3,12 +3,18 @@
 from __future__ import annotations
 
 from enum import StrEnum
-import json
+import time
 
-from aiohttp import ClientResponse, ClientSession
+from aiohttp import ClientResponse, ClientSession, ClientTimeout
+import orjson
 
 DEFAULT_PORT = 7000
 DEFAULT_URL = f"http://vestaboard.local:{DEFAULT_PORT}"
+ENDPOINT_TIMEOUT = ClientTimeout(total=5)
+
+# Seconds to cache check_endpoint results for a given endpoint and API key
+VALID_CACHE_TTL = 60
+INVALID_CACHE_TTL = 10
 
 
 class InvalidApiKeyError(Exception):
@@ -20,10 +26,9 @@ async def _parse_response(
 ) -> dict | str | list[list[int]] | None:
     """Parse response."""
     try:
-        raw = await response.text()
-        payload = json.loads(raw)
+        payload = orjson.loads(await response.read())
         return payload.get(key) if key else payload
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         return None
 
 
@@ -35,6 +40,9 @@ class EndpointStatus(StrEnum):
     UNKNOWN = "unknown"
 
 
+_validation_cache: dict[tuple[str, str], tuple[float, EndpointStatus]] = {}
+
+
 class VestaboardLocalClient:
     """Provides a Vestaboard Local API client interface.
 
@@ -46,7 +54,8 @@ class VestaboardLocalClient:
     constructed by calling :py:meth:`~enable`, which also returns the Local API
     key for future reuse.
 
-    An alternate ``base_url`` can also be specified.
+    An alternate ``base_url`` can also be specified. The ``session`` is owned by
+    the caller so that connections can be pooled and kept alive across clients.
     """
 
     def __init__(
@@ -54,12 +63,11 @@ class VestaboardLocalClient:
         *,
         api_key: str | None = None,
         base_url: str = DEFAULT_URL,
-        session: ClientSession | None = None,
+        session: ClientSession,
     ):
         self.api_key = api_key
         self.base_url = base_url
-        self.session = session or ClientSession()
-        self.should_close = session is None
+        self.session = session
         self.data: list[list[int]] | None = None
 
     def __repr__(self):
@@ -71,7 +79,9 @@ class VestaboardLocalClient:
         support has been enabled."""
         return self.api_key is not None
 
-    async def enable(self, enablement_token: str) -> str | None:
+    async def enable(
+        self, enablement_token: str, timeout: ClientTimeout | None = None
+    ) -> str | None:
         """Enable the Vestaboard's Local API using a Local API Enablement Token.
 
         If successful, the Vestaboard's Local API key will be returned and the
@@ -80,6 +90,7 @@ class VestaboardLocalClient:
         resp = await self.session.post(
             f"{self.base_url}/local-api/enablement",
             headers={"X-Vestaboard-Local-Api-Enablement-Token": enablement_token},
+            timeout=timeout or self.session.timeout,
         )
         resp.raise_for_status()
 
@@ -89,15 +100,19 @@ class VestaboardLocalClient:
 
         return api_key
 
-    async def read_message(self) -> list[list[int]] | None:
+    async def read_message(
+        self, timeout: ClientTimeout | None = None
+    ) -> list[list[int]] | None:
         """Read the Vestaboard's current message."""
         if not self.enabled:
             raise RuntimeError("Local API has not been enabled")
         resp = await self.session.get(
             f"{self.base_url}/local-api/message",
             headers={"X-Vestaboard-Local-Api-Key": self.api_key},
+            timeout=timeout or self.session.timeout,
         )
-        if resp.status == 401 and (await resp.text()) == "Invalid API key":
+        if resp.status == 401:
+            resp.release()
             raise InvalidApiKeyError("Invalid API key")
         resp.raise_for_status()
         if message := await _parse_response(resp, "message"):
@@ -105,7 +120,9 @@ class VestaboardLocalClient:
         return message
 
     async def write_message(
-        self, json: dict[str, str | int | list[list[int]]] | list[list[int]]
+        self,
+        json: dict[str, str | int | list[list[int]]] | list[list[int]],
+        timeout: ClientTimeout | None = None,
     ) -> bool:
         """Write a message to the Vestaboard.
 
@@ -127,33 +144,47 @@ class VestaboardLocalClient:
         if not self.enabled:
             raise RuntimeError("Local API has not been enabled")
 
-        payload = dict(json) if isinstance(json, dict) else json
-        if isinstance(payload, dict) and payload.get("strategy") == "classic":
-            payload.pop("strategy")
+        payload = json
+        if isinstance(json, dict) and json.get("strategy") == "classic":
+            payload = {k: v for k, v in json.items() if k != "strategy"}
 
         resp = await self.session.post(
             f"{self.base_url}/local-api/message",
             headers={"X-Vestaboard-Local-Api-Key": self.api_key},
             json=payload,
+            timeout=timeout or self.session.timeout,
         )
         resp.raise_for_status()
         return resp.status == 201
 
-    async def check_endpoint(self) -> EndpointStatus:
-        """Test the Vestaboard's endpoint to determine if it is a Vestaboard."""
-        resp = await self.session.get(
+    async def check_endpoint(
+        self, timeout: ClientTimeout = ENDPOINT_TIMEOUT
+    ) -> EndpointStatus:
+        """Test the Vestaboard's endpoint to determine if it is a Vestaboard.
+
+        Valid and invalid API key results are cached briefly per endpoint and key,
+        so repeated probes (e.g. during a config flow) skip the round trip.
+        """
+        key = (self.base_url, self.api_key or "")
+        if (cached := _validation_cache.get(key)) and cached[0] > time.monotonic():
+            return cached[1]
+
+        async with self.session.get(
             f"{self.base_url}/local-api/message",
             headers={"X-Vestaboard-Local-Api-Key": self.api_key or ""},
-            timeout=5,
-        )
-        if resp.status == 200 and (message := await _parse_response(resp, "message")):
-            self.data = message
+            timeout=timeout,
+        ) as resp:
+            status = resp.status
+        if status == 200:
+            _validation_cache[key] = (
+                time.monotonic() + VALID_CACHE_TTL,
+                EndpointStatus.VALID,
+            )
             return EndpointStatus.VALID
-        if resp.status == 401 and (await resp.text()) == "Invalid API key":
+        if status == 401:
+            _validation_cache[key] = (
+                time.monotonic() + INVALID_CACHE_TTL,
+                EndpointStatus.INVALID_API_KEY,
+            )
             return EndpointStatus.INVALID_API_KEY
         return EndpointStatus.UNKNOWN
-
-    async def close(self) -> None:
-        """Close the underlying session if owned by the client."""
-        if self.should_close:
-            await self.session.close()
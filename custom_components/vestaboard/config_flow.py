@@ -258,7 +258,8 @@ class VestaboardConfigFlow(ConfigFlow, domain=DOMAIN):
                 errors["base"] = "invalid_api_key"
             elif status == EndpointStatus.VALID:
                 if write:
-                    model = VestaboardModel.from_color(COLOR_BLACK, client.data)
+                    data = await client.read_message()
+                    model = VestaboardModel.from_color(COLOR_BLACK, data)
                     message = (
                         VESTABOARD_CONNECTED_MESSAGE
                         if model.is_flagship
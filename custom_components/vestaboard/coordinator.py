@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta
+from functools import lru_cache
 import logging
 
-import async_timeout
+from aiohttp import ClientTimeout
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import CALLBACK_TYPE, HomeAssistant
@@ -27,9 +28,22 @@ from .vestaboard_model import VestaboardModel
 
 _LOGGER = logging.getLogger(__name__)
 
+UPDATE_TIMEOUT = ClientTimeout(total=10)
+
 type VestaboardConfigEntry = ConfigEntry[VestaboardCoordinator]
 
 
+def _seconds_of_day(value: datetime | time) -> int:
+    """Return the number of whole seconds since midnight."""
+    return value.hour * 3600 + value.minute * 60 + value.second
+
+
+@lru_cache(maxsize=8)
+def _render_png(data: tuple[tuple[int, ...], ...], color: str) -> bytes:
+    """Render a png of the board, reusing recent renders of the same message."""
+    return create_png(data, color)
+
+
 class VestaboardCoordinator(DataUpdateCoordinator):
     """Vestaboard data update coordinator."""
 
@@ -70,6 +84,12 @@ class VestaboardCoordinator(DataUpdateCoordinator):
             self.quiet_end = dt_util.parse_time(end)
         else:
             self.quiet_start = self.quiet_end = None
+        self._quiet_range: tuple[int, int] | None = None
+        if self.quiet_start and self.quiet_end:
+            self._quiet_range = (
+                _seconds_of_day(self.quiet_start),
+                _seconds_of_day(self.quiet_end),
+            )
 
     @property
     def default_transition_settings(self) -> dict[str, str | int]:
@@ -83,23 +103,23 @@ class VestaboardCoordinator(DataUpdateCoordinator):
                 self.model = VestaboardModel.from_color(self.model_color, data)
             self.last_updated = dt_util.now()
             self.message = decode(data)
-            self.image = create_png(data, self.model_color)
+            self.image = _render_png(tuple(map(tuple, data)), self.model_color)
         return data
 
     def quiet_hours(self) -> bool:
         """Check if quiet hours."""
-        if self.quiet_start and self.quiet_end:
-            now = dt_util.now().time()
-            if self.quiet_start < self.quiet_end:
-                return self.quiet_start <= now < self.quiet_end
-            return self.quiet_start <= now or now < self.quiet_end
-        return False
+        if (quiet_range := self._quiet_range) is None:
+            return False
+        start, end = quiet_range
+        now = _seconds_of_day(dt_util.now())
+        if start < end:
+            return start <= now < end
+        return start <= now or now < end
 
     async def _async_update_data(self):
         """Fetch data from Vestaboard."""
         try:
-            async with async_timeout.timeout(10):
-                data = await self.vestaboard.read_message()
+            data = await self.vestaboard.read_message(timeout=UPDATE_TIMEOUT)
         except InvalidApiKeyError as err:
             raise ConfigEntryAuthFailed from err
         except Exception as ex:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import cache, lru_cache
 from importlib.resources import files
 import io
 from typing import Final
@@ -37,12 +38,19 @@ def get_font_bytes(name: str = FONT_NAME) -> bytes:
 
 def load_font(size: float | None) -> ImageFont:
     """Load a font."""
+    return _load_font(None if size is None else int(size))
+
+
+@lru_cache(maxsize=32)
+def _load_font(size: int | None) -> ImageFont:
+    """Load and cache a font by size."""
     try:
         return ImageFont.truetype(get_font_buffer(), size=size)
     except OSError:
         return ImageFont.load_default(size)
 
 
+@cache
 def load_emoji_font() -> ImageFont:
     """Load an emoji font."""
     try:
@@ -3,11 +3,15 @@
 from __future__ import annotations
 
 import base64
+from functools import lru_cache
 import io
+from itertools import repeat
 import logging
-from typing import TYPE_CHECKING, Any, cast
+import math
+from typing import TYPE_CHECKING, Any, Final, cast
 
-from PIL import Image, ImageDraw, ImageOps
+import numpy as np
+from PIL import Image, ImageColor, ImageDraw, ImageOps
 from pyvbml.character_codes import COLOR_CODES, CharacterCode
 
 from homeassistant.core import HomeAssistant, callback
@@ -33,6 +37,14 @@ _LOGGER = logging.getLogger(__name__)
 PRINTABLE = (
     " ABCDEFGHIJKLMNOPQRSTUVWXYZ1234567890!@#$() - +&=;: '\"%,.  /? °🟥🟧🟨🟩🟦🟪⬜⬛■"
 )
+_COLOR_CODES: Final = frozenset(map(int, COLOR_CODES))
+_SYMBOLS: Final[dict[int, str]] = dict(enumerate(PRINTABLE))
+_XML_SYMBOLS: Final[dict[int, str]] = {
+    code: char.replace("&", "&amp;") for code, char in _SYMBOLS.items()
+}
+_SVG_COLOR_CLASSES: Final[dict[int, str]] = {
+    code: CharacterCode(code).name.lower() for code in _COLOR_CODES
+}
 
 
 async def create_client(
@@ -53,10 +65,18 @@ async def create_client(
 def draw_emoji(emoji: str, size: tuple[int, int]) -> Image.Image:
     """Draw a scaled emoji image at the requested size.
 
+    The returned image is cached and shared, so it must not be modified.
+
     :param size: The requested size in pixels, as a tuple or array:
         (width, height).
     :returns: An :py:class:`~PIL.Image.Image` object.
     """
+    return _draw_emoji(emoji, *size)
+
+
+@lru_cache(maxsize=128)
+def _draw_emoji(emoji: str, target_width: int, target_height: int) -> Image.Image:
+    """Draw a scaled emoji image."""
     # draw the emoji
     width, height = 76, 90
     emoji_font = load_emoji_font()
@@ -72,7 +92,195 @@ def draw_emoji(emoji: str, size: tuple[int, int]) -> Image.Image:
     img.putalpha(mask)
 
     # size appropriately and return
-    return ImageOps.contain(img, size, Image.LANCZOS)
+    return ImageOps.contain(img, (target_width, target_height), Image.LANCZOS)
+
+
+class _BoardRenderer:
+    """Render boards of a single model, color and height to png.
+
+    Geometry and fonts only depend on the model, color and output height, so they
+    are computed once and shared by every render.
+    """
+
+    def __init__(self, model: VestaboardModel, height: int) -> None:
+        """Initialize the renderer."""
+        self.model = model
+
+        #  Physical scale
+        px_per_in = height / model.height
+        self.height = height
+        self.width = int(model.width * px_per_in)
+
+        # Convert physical dimensions to pixels
+        self.outer_border = model.frame_thickness * px_per_in
+        self.inner_border = model.frame_border * px_per_in
+
+        self.bit_w = BIT_WIDTH * px_per_in
+        self.bit_h = BIT_HEIGHT * px_per_in
+
+        self.gap_x = BIT_WIDTH_SPACING * px_per_in
+        self.gap_y = BIT_HEIGHT_SPACING * px_per_in
+
+        # Starting position of first bit
+        self.start_x = self.outer_border + self.inner_border
+        self.start_y = self.outer_border + self.inner_border
+
+        # Top left corner of each bit column and row
+        self.xs = [
+            self.start_x + col * (self.bit_w + self.gap_x)
+            for col in range(model.columns)
+        ]
+        self.ys = [
+            self.start_y + row * (self.bit_h + self.gap_y) for row in range(model.rows)
+        ]
+
+        # Font
+        self.font = load_font(int(self.bit_h * 0.8))
+        self.logo_font = load_font(int(self.bit_h * 0.3))
+
+        # Calculate height of squares based on the letter O
+        self.ascent, self.descent = self.font.getmetrics()
+        _, self.top, _, bottom = self.font.getbbox("O")
+        self.glyph_height = bottom - self.top
+
+        # Pixel spans of color tiles and their flap stripes, relative to each bit
+        vp_top = (self.ascent + self.descent - self.glyph_height) / 2 + self.top
+        vp_bottom = vp_top + self.glyph_height
+        bit_pad = self.bit_w * 0.02
+        stripe_center = self.bit_h * 0.1 + self.bit_h * 0.68 / 2
+        stripe_top = stripe_center - self.bit_h * 0.01
+        stripe_bottom = stripe_center + self.bit_h * 0.01
+
+        def span(start: float, end: float) -> tuple[int, int]:
+            return int(start), int(end) + 1
+
+        self._paste_xs = [int(x) for x in self.xs]
+        self._paste_ys = [int(y) for y in self.ys]
+        self._emoji_ys = [int(y + vp_top) for y in self.ys]
+        self._tile_xs = [span(x + bit_pad, x + self.bit_w - bit_pad) for x in self.xs]
+        self._tile_ys = [span(y + vp_top, y + vp_bottom) for y in self.ys]
+        self._stripe_xs = [span(x, x + self.bit_w) for x in self.xs]
+        self._stripe_ys = [span(y + stripe_top, y + stripe_bottom) for y in self.ys]
+        self._colors = {
+            code: ImageColor.getrgb(color) for code, color in model.color_map.items()
+        }
+        self._frame_color = ImageColor.getrgb(model.frame_color)
+
+        self._base_pixels: dict[bool, np.ndarray] = {}
+
+        # Rasterize each character once as a mask the size of a bit
+        tile_size = (math.ceil(self.bit_w), math.ceil(self.bit_h))
+        self._glyphs: dict[int, Image.Image] = {}
+        for code, char in enumerate(PRINTABLE):
+            mask = Image.new("L", tile_size)
+            ImageDraw.Draw(mask).text(
+                (self.bit_w / 2, self.bit_h / 2),
+                char,
+                fill=255,
+                font=self.font,
+                anchor="mm",
+            )
+            if mask.getbbox():
+                self._glyphs[code] = mask
+
+    def _board_pixels(self, draw_bit: bool) -> np.ndarray:
+        """Return the empty board pixels, drawn once and reused for every render."""
+        if (pixels := self._base_pixels.get(draw_bit)) is not None:
+            return pixels
+
+        model = self.model
+        width, height = self.width, self.height
+        bit_w, bit_h = self.bit_w, self.bit_h
+
+        img = Image.new("RGB", (width, height), color=model.frame_color)
+        draw = ImageDraw.Draw(img)
+
+        # Board background
+        draw.rectangle(
+            [(0, 0), (width, height)],
+            outline=model.bit_color,
+            width=int(self.outer_border),
+        )
+
+        # Draw bits
+        if draw_bit:
+            for ypos in self.ys:
+                for xpos in self.xs:
+                    draw.rectangle(
+                        [(xpos, ypos), (xpos + bit_w, ypos + bit_h)],
+                        fill=model.bit_color,
+                    )
+
+        # logo placement
+        logo_text = "VESTABOARD"
+
+        text_bbox = draw.textbbox((0, 0), logo_text, font=self.logo_font)
+        text_height = text_bbox[3] - text_bbox[1]
+
+        bottom_inner_top = self.start_y + model.rows * (bit_h + self.gap_y)
+        bottom_inner_height = self.inner_border
+
+        # vertical center of inner border
+        inner_center_y = bottom_inner_top + bottom_inner_height / 2
+
+        # adjust y to place visual center of text at inner_center_y
+        logo_y = inner_center_y - text_height
+
+        draw.text(
+            (width / 2, logo_y),
+            logo_text,
+            fill=model.logo_color,
+            anchor="md",
+            font=self.logo_font,
+        )
+
+        self._base_pixels[draw_bit] = pixels = np.asarray(img)
+        return pixels
+
+    def render(self, data: list[list[int]], draw_bit: bool = True) -> bytes:
+        """Render the character codes to png."""
+        model = self.model
+        emoji_size = (int(self.bit_w), int(self.bit_h))
+        colors = self._colors
+        frame = self._frame_color
+
+        # Fill color tiles directly in the pixel array, collecting the cells that
+        # need glyphs or emoji composited on top
+        pixels = self._board_pixels(draw_bit).copy()
+        emoji_cells: list[tuple[int, int, str]] = []
+        glyph_cells: list[tuple[int, int, Image.Image]] = []
+        for row, characters in enumerate(data):
+            tile_y0, tile_y1 = self._tile_ys[row]
+            stripe_y0, stripe_y1 = self._stripe_ys[row]
+            for col, code in enumerate(characters):
+                if (emoji := model.emoji_for_code(code)) is not None:
+                    emoji_cells.append((row, col, emoji))
+                elif code in _COLOR_CODES:
+                    tile_x0, tile_x1 = self._tile_xs[col]
+                    stripe_x0, stripe_x1 = self._stripe_xs[col]
+                    pixels[tile_y0:tile_y1, tile_x0:tile_x1] = colors[code]
+                    pixels[stripe_y0:stripe_y1, stripe_x0:stripe_x1] = frame
+                elif (glyph := self._glyphs.get(code)) is not None:
+                    glyph_cells.append((row, col, glyph))
+
+        img = Image.fromarray(pixels, "RGB")
+        for row, col, emoji in emoji_cells:
+            emoji_img = draw_emoji(emoji, emoji_size)
+            img.paste(emoji_img, (self._paste_xs[col], self._emoji_ys[row]), emoji_img)
+        for row, col, glyph in glyph_cells:
+            img.paste(
+                model.text_color, (self._paste_xs[col], self._paste_ys[row]), glyph
+            )
+
+        buffer = io.BytesIO()
+        img.save(buffer, format="PNG", compress_level=1)
+        return buffer.getvalue()
+
+
+@lru_cache(maxsize=8)
+def _get_renderer(color: str, model: str, height: int) -> _BoardRenderer:
+    """Return a cached board renderer."""
+    return _BoardRenderer(VestaboardModel(color, model), height)
 
 
 def create_png(
@@ -81,141 +289,15 @@ def create_png(
     height: int = 1080,
     draw_bit: bool = True,
 ) -> bytes:
+    """Create a png for the message from the Vestaboard."""
     model = VestaboardModel.from_color(color, data)
+    return _get_renderer(model.color, model.model, height).render(data, draw_bit)
 
-    #  Physical scale
-    px_per_in = height / model.height
-    width = int(model.width * px_per_in)
-
-    img = Image.new("RGB", (width, height), color=model.frame_color)
-    draw = ImageDraw.Draw(img)
-
-    # Convert physical dimensions to pixels
-
-    # Board background
-    outer_border = model.frame_thickness * px_per_in
-    draw.rectangle(
-        [(0, 0), (width, height)],
-        outline=model.bit_color,
-        width=int(outer_border),
-    )
-
-    inner_border = model.frame_border * px_per_in
-
-    bit_w = BIT_WIDTH * px_per_in
-    bit_h = BIT_HEIGHT * px_per_in
 
-    gap_x = BIT_WIDTH_SPACING * px_per_in
-    gap_y = BIT_HEIGHT_SPACING * px_per_in
-
-    # Starting position of first bit
-    start_x = outer_border + inner_border
-    start_y = outer_border + inner_border
-
-    # Font
-    font = load_font(int(bit_h * 0.8))
-
-    # Calculate height of squares based on the letter O
-    ascent, descent = font.getmetrics()
-    font_height = ascent + descent
-    text_bbox = draw.textbbox((0, 0), "O", font=font)
-    _, top, _, bottom = text_bbox
-    glyph_height = bottom - top
-
-    # Draw bits
-    for row, characters in enumerate(data):
-        ypos = start_y + row * (bit_h + gap_y)
-        for col, code in enumerate(characters):
-            xpos = start_x + col * (bit_w + gap_x)
-
-            if draw_bit:
-                draw.rectangle(
-                    [(xpos, ypos), (xpos + bit_w, ypos + bit_h)],
-                    fill=model.bit_color,
-                )
-
-            if code in model.emoji_map:
-                emoji = model.emoji_for_code(code)
-                emoji_img = draw_emoji(emoji, (int(bit_w), int(bit_h)))
-                vertical_padding = (font_height - glyph_height) / 2
-                img.paste(
-                    emoji_img,
-                    (int(xpos), int(ypos + vertical_padding + top)),
-                    emoji_img,
-                )
-
-            elif code in COLOR_CODES:
-                vertical_padding = (font_height - glyph_height) / 2
-                bit_pad = bit_w * 0.02
-                draw.rectangle(
-                    [
-                        (xpos + bit_pad, ypos + vertical_padding + top),
-                        (
-                            xpos + bit_w - bit_pad,
-                            ypos + vertical_padding + top + glyph_height,
-                        ),
-                    ],
-                    fill=model.color_map[code],
-                )
-
-                flap_top = ypos + bit_h * 0.1
-                flap_bottom = ypos + bit_h * 0.78
-                flap_h = flap_bottom - flap_top
-                stripe_h = bit_h * 0.02
-                stripe_center = flap_top + flap_h / 2
-                draw.rectangle(
-                    [
-                        (xpos, stripe_center - stripe_h / 2),
-                        (xpos + bit_w, stripe_center + stripe_h / 2),
-                    ],
-                    fill=model.frame_color,
-                )
-
-            else:
-                char = symbol(code)
-                draw.text(
-                    (xpos + bit_w / 2, ypos + bit_h / 2),
-                    char,
-                    fill=model.text_color,
-                    font=font,
-                    anchor="mm",
-                )
-
-    # logo placement
-    logo_text = "VESTABOARD"
-    logo_font = load_font(int(bit_h * 0.3))
-
-    text_bbox = draw.textbbox((0, 0), logo_text, font=logo_font)
-    text_height = text_bbox[3] - text_bbox[1]
-
-    bottom_inner_top = start_y + model.rows * (bit_h + gap_y)
-    bottom_inner_height = inner_border
-
-    # vertical center of inner border
-    inner_center_y = bottom_inner_top + bottom_inner_height / 2
-
-    # adjust y to place visual center of text at inner_center_y
-    logo_y = inner_center_y - text_height
-
-    draw.text(
-        (width / 2, logo_y),
-        logo_text,
-        fill=model.logo_color,
-        anchor="md",
-        font=logo_font,
-    )
-
-    buffer = io.BytesIO()
-    img.save(buffer, format="PNG")
-    return buffer.getvalue()
-
-
-def create_svg(data: list[list[int]], color: str = COLOR_BLACK) -> str:
-    """Create an svg for the message from the Vestaboard.
-
-    This currently only works for the original Vestaboard Flagship model (6 x 22).
-    """
-    model = VestaboardModel.from_color(color, data)
+@lru_cache(maxsize=4)
+def _svg_header(color: str) -> str:
+    """Return the svg prefix, styles and board background for a color."""
+    model = VestaboardModel.from_color(color)
 
     encoded_font = base64.b64encode(get_font_bytes()).decode("ascii")
     font_face = f"""@font-face {{
@@ -234,6 +316,17 @@ def create_svg(data: list[list[int]], color: str = COLOR_BLACK) -> str:
     )
     svg += f".logo {{ font-size: 0.10px; fill: {model.bit_color}; }} </style>"
     svg += '<rect class="board" x="0.01" y="0.01" width="3.98" height="1.75" />'
+    return svg
+
+
+def create_svg(data: list[list[int]], color: str = COLOR_BLACK) -> str:
+    """Create an svg for the message from the Vestaboard.
+
+    This currently only works for the original Vestaboard Flagship model (6 x 22).
+    """
+    model = VestaboardModel.from_color(color, data)
+
+    parts = [_svg_header(model.color)]
     start = 0.2
     row_multiplier = 0.24
     column_multiplier = 0.166
@@ -241,26 +334,30 @@ def create_svg(data: list[list[int]], color: str = COLOR_BLACK) -> str:
         for column, code in enumerate(characters):
             xpos = round(start + column * column_multiplier, 3)
             ypos = round(start + row * row_multiplier, 3)
-            if code in COLOR_CODES:
-                svg += f'<rect class="char {CharacterCode(code).name.lower()}" x="{xpos}" y="{ypos}"/>'
+            if code in _COLOR_CODES:
+                parts.append(
+                    f'<rect class="char {_SVG_COLOR_CLASSES[code]}" x="{xpos}" y="{ypos}"/>'
+                )
             else:
-                svg += f'<text class="char" x="{xpos + 0.045}" y="{ypos}">{symbol(code).replace("&", "&amp;")}</text>'
-    svg += '<text class="logo" x="50%" y="1.68">VESTABOARD</text></svg>'
-    return svg
+                parts.append(
+                    f'<text class="char" x="{xpos + 0.045}" y="{ypos}">{_XML_SYMBOLS.get(code, " ")}</text>'
+                )
+    parts.append('<text class="logo" x="50%" y="1.68">VESTABOARD</text></svg>')
+    return "".join(parts)
 
 
-def decode(data: list[int] | list[list[int]]) -> None:
+def decode(data: list[int] | list[list[int]]) -> str:
     """Prints a console-formatted representation of encoded character data.
 
     ``data`` may be a single list or a two-dimensional array of character codes.
     """
     rows = cast(list[list[int]], data if data and isinstance(data[0], list) else [data])
-    return "\n".join((f"{''.join(map(symbol, row))}" for row in rows))
+    return "\n".join("".join(map(_SYMBOLS.get, row, repeat(" "))) for row in rows)
 
 
 def symbol(code: int) -> str:
     """Convert a character code to symbol."""
-    return PRINTABLE[code] if 0 <= code < len(PRINTABLE) else " "
+    return _SYMBOLS.get(code, " ")
 
 
 @callback
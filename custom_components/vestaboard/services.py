@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import timedelta
+import re
+import sys
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
+import numpy as np
 import voluptuous as vol
 
 from homeassistant.const import CONF_DEVICE_ID
@@ -31,67 +37,107 @@ from .const import (
 )
 from .helpers import async_get_coordinator_by_device_id
 
-_calendar = vol.Schema(
-    {
-        vol.Required("month"): vol.All(vol.Coerce(int), vol.Range(min=1, max=12)),
-        vol.Required("year"): vol.Coerce(int),
-        vol.Optional("defaultDayColor"): vol.All(
-            vol.Coerce(int), vol.Range(min=63, max=70)
-        ),
-        vol.Optional("days"): vol.Coerce(dict[str, int]),
-        vol.Optional("hideSMTWTFS"): vol.Coerce(bool),
-        vol.Optional("hideDates"): vol.Coerce(bool),
-        vol.Optional("hideMonthYear"): vol.Coerce(bool),
-    }
-)
-_character_codes = vol.All(vol.Coerce(int), vol.Range(min=0, max=71))
-_random_colors = vol.Schema(
-    {vol.Optional("colors"): [vol.All(int, vol.Range(min=63, max=71))]}
-)
-_raw_characters = vol.All(cv.ensure_list, [vol.All(cv.ensure_list, [_character_codes])])
-_style = vol.Schema(
-    {
-        vol.Optional("height"): vol.All(vol.Coerce(int), vol.Range(min=1, max=6)),
-        vol.Optional("width"): vol.All(vol.Coerce(int), vol.Range(min=1, max=22)),
-        vol.Optional(CONF_JUSTIFY): vol.In(ALIGN_HORIZONTAL),
-        vol.Optional(CONF_ALIGN): vol.In(ALIGN_VERTICAL),
-        vol.Optional("absolutePosition"): vol.Schema(
-            {
-                vol.Required("x"): vol.All(vol.Coerce(int), vol.Range(min=0, max=21)),
-                vol.Required("y"): vol.All(vol.Coerce(int), vol.Range(min=0, max=5)),
-            }
-        ),
-    }
+if TYPE_CHECKING:
+    from .coordinator import VestaboardCoordinator
+
+# Double spaces and blank lines in plain messages are filled with black bits,
+# substituted in a single pass over the message
+_TEMPLATE_REPLACEMENTS = {"  ": "{70}{70}", "\n\n": "\n{70}\n"}
+_TEMPLATE_PATTERN = re.compile("|".join(map(re.escape, _TEMPLATE_REPLACEMENTS)))
+
+# Shared style for plain messages using the default alignment
+_DEFAULT_STYLE = MappingProxyType(
+    {CONF_ALIGN: ALIGN_CENTER, CONF_JUSTIFY: ALIGN_CENTER}
 )
-_component = vol.All(
-    vol.Schema(
-        {
-            vol.Optional("template"): cv.string,
-            vol.Optional("rawCharacters"): _raw_characters,
-            vol.Optional("calendar"): _calendar,
-            vol.Optional("randomColors"): _random_colors,
-            vol.Optional("style"): _style,
-        }
+# Templates shorter than this are interned, since repeated messages are common
+_INTERN_MAX_LENGTH = 256
+
+
+def _template_replacement(match: re.Match[str]) -> str:
+    """Return the replacement for a matched template sequence."""
+    return _TEMPLATE_REPLACEMENTS[match.group(0)]
+
+
+def _message_vbml(message: str, align: str, justify: str) -> dict[str, Any]:
+    """Wrap a plain message in a single-component VBML payload."""
+    template = _TEMPLATE_PATTERN.sub(_template_replacement, message)
+    if len(template) < _INTERN_MAX_LENGTH:
+        template = sys.intern(template)
+    if align == justify == ALIGN_CENTER:
+        style = _DEFAULT_STYLE
+    else:
+        style = {CONF_ALIGN: align, CONF_JUSTIFY: justify}
+    return {"components": [{"style": style, "template": template}]}
+
+
+def _raw_characters(value: Any) -> list[list[int]]:
+    """Validate a grid of character codes in a single vectorized pass."""
+    if not value:
+        return []
+    try:
+        codes = np.asarray(value, dtype=np.int16)
+    except (TypeError, ValueError, OverflowError) as ex:
+        raise vol.Invalid(f"invalid character codes: {ex}") from ex
+    if codes.ndim != 2:
+        raise vol.Invalid("rawCharacters must be a list of rows of character codes")
+    if codes.size and (codes.min() < 0 or codes.max() > 71):
+        raise vol.Invalid("character codes must be between 0 and 71")
+    return codes.tolist()
+
+
+# Nested schemas are plain dicts so they are compiled into their parent schema
+# rather than dispatched through a separate Schema call on every validation
+_calendar_days = {cv.string: vol.All(vol.Coerce(int), vol.Range(min=0, max=71))}
+_calendar = {
+    vol.Required("month"): vol.All(vol.Coerce(int), vol.Range(min=1, max=12)),
+    vol.Required("year"): vol.Coerce(int),
+    vol.Optional("defaultDayColor"): vol.All(
+        vol.Coerce(int), vol.Range(min=63, max=70)
     ),
-    cv.has_at_least_one_key("template", "rawCharacters", "calendar", "randomColors"),
-)
-
-VBML_SCHEMA = vol.Schema(
+    vol.Optional("days"): _calendar_days,
+    vol.Optional("hideSMTWTFS"): vol.Coerce(bool),
+    vol.Optional("hideDates"): vol.Coerce(bool),
+    vol.Optional("hideMonthYear"): vol.Coerce(bool),
+}
+_random_colors = {vol.Optional("colors"): [vol.All(int, vol.Range(min=63, max=71))]}
+_style = {
+    vol.Optional("height"): vol.All(vol.Coerce(int), vol.Range(min=1, max=6)),
+    vol.Optional("width"): vol.All(vol.Coerce(int), vol.Range(min=1, max=22)),
+    vol.Optional(CONF_JUSTIFY): vol.In(ALIGN_HORIZONTAL),
+    vol.Optional(CONF_ALIGN): vol.In(ALIGN_VERTICAL),
+    vol.Optional("absolutePosition"): {
+        vol.Required("x"): vol.All(vol.Coerce(int), vol.Range(min=0, max=21)),
+        vol.Required("y"): vol.All(vol.Coerce(int), vol.Range(min=0, max=5)),
+    },
+}
+_component = vol.All(
     {
-        vol.Optional("props"): {cv.string: cv.string},
-        # Styles to set the size of the rendered array of arrays is purposefully missing and controlled by code
-        vol.Required("components"): vol.All(cv.ensure_list, [_component]),
-    }
+        vol.Optional("template"): cv.string,
+        vol.Optional("rawCharacters"): _raw_characters,
+        vol.Optional("calendar"): _calendar,
+        vol.Optional("randomColors"): _random_colors,
+        vol.Optional("style"): _style,
+    },
+    cv.has_at_least_one_key("template", "rawCharacters", "calendar", "randomColors"),
 )
-
-SERVICE_MESSAGE_SCHEMA = vol.All(
-    vol.Schema(
+_vbml = {
+    vol.Optional("props"): {cv.string: cv.string},
+    # Styles to set the size of the rendered array of arrays is purposefully missing and controlled by code
+    vol.Required("components"): vol.All(cv.ensure_list, [_component]),
+}
+
+VBML_SCHEMA = vol.Schema(_vbml)
+
+# Wrapped in a Schema so the whole tree is compiled once at import; a bare
+# vol.All recompiles its sub-validators on every call
+SERVICE_MESSAGE_SCHEMA = vol.Schema(
+    vol.All(
         {
             vol.Required(CONF_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
             vol.Optional(CONF_MESSAGE): cv.string,
             vol.Optional(CONF_JUSTIFY, default=ALIGN_CENTER): vol.In(ALIGN_HORIZONTAL),
             vol.Optional(CONF_ALIGN, default=ALIGN_CENTER): vol.In(ALIGN_VERTICAL),
-            vol.Optional(CONF_VBML): VBML_SCHEMA,
+            vol.Optional(CONF_VBML): _vbml,
             vol.Optional(CONF_STRATEGY): vol.In(CONF_TRANSITIONS),
             vol.Optional(CONF_STEP_SIZE): cv.positive_int,
             vol.Optional(CONF_STEP_INTERVAL_MS): cv.positive_int,
@@ -100,8 +146,8 @@ SERVICE_MESSAGE_SCHEMA = vol.All(
             ),
             vol.Optional(CONF_BYPASS_QUIET_HOURS): cv.boolean,
         },
-    ),
-    cv.has_at_least_one_key(CONF_MESSAGE, CONF_VBML),
+        cv.has_at_least_one_key(CONF_MESSAGE, CONF_VBML),
+    )
 )
 
 
@@ -114,15 +160,10 @@ def async_setup_services(hass: HomeAssistant) -> None:
         if not (vbml := call.data.get(CONF_VBML)):
             align = call.data.get(CONF_ALIGN, ALIGN_CENTER)
             justify = call.data.get(CONF_JUSTIFY, ALIGN_CENTER)
-            message = {
-                "style": {CONF_ALIGN: align, CONF_JUSTIFY: justify},
-                "template": call.data.get(CONF_MESSAGE, "")
-                .replace("  ", "{70}{70}")
-                .replace("\n\n", "\n{70}\n"),
-            }
-            components = [message]
+            vbml = _message_vbml(call.data.get(CONF_MESSAGE, ""), align, justify)
 
-            vbml = {"components": components}
+        bypass_quiet_hours = call.data.get(CONF_BYPASS_QUIET_HOURS)
+        duration = call.data.get(CONF_DURATION)
 
         base_json = {}
         if strategy := call.data.get(CONF_STRATEGY):
@@ -132,39 +173,69 @@ def async_setup_services(hass: HomeAssistant) -> None:
             if step_interval := call.data.get(CONF_STEP_INTERVAL_MS):
                 base_json[CONF_STEP_INTERVAL_MS] = step_interval
 
+        coordinators: list[VestaboardCoordinator] = []
         for device_id in call.data[CONF_DEVICE_ID]:
-            json = dict(base_json)
             coordinator = async_get_coordinator_by_device_id(hass, device_id)
-            if not call.data.get(CONF_BYPASS_QUIET_HOURS) and coordinator.quiet_hours():
+            if not bypass_quiet_hours and coordinator.quiet_hours():
                 continue
-
-            if coordinator.model is None:
-                await coordinator.async_request_refresh()
-            if coordinator.model is None:
-                raise HomeAssistantError("Vestaboard model is not initialized")
-            try:
-                rows = coordinator.model.parse_vbml(vbml)
-            except Exception as ex:
-                raise HomeAssistantError(f"Invalid VBML payload: {ex}") from ex
-            json["characters"] = rows
-
-            if CONF_STRATEGY not in json:
-                json.update(coordinator.default_transition_settings)
-
-            if duration := call.data.get(CONF_DURATION):  # This is a temporary message
-                if coordinator._cancel_cb:
-                    coordinator._cancel_cb()
-                expiration = dt_now() + timedelta(seconds=duration)
-                coordinator.temporary_message_expiration = expiration
+            coordinators.append(coordinator)
+
+        # Refresh boards that haven't reported their model yet concurrently
+        await asyncio.gather(
+            *(
+                coordinator.async_request_refresh()
+                for coordinator in coordinators
+                if coordinator.model is None
+            )
+        )
+        if any(coordinator.model is None for coordinator in coordinators):
+            raise HomeAssistantError("Vestaboard model is not initialized")
+
+        # Boards of the same size render identical rows, so parse once per size
+        rows_by_size: dict[tuple[int, int], list[list[int]]] = {}
+        targets: list[tuple[VestaboardCoordinator, list[list[int]]]] = []
+        for coordinator in coordinators:
+            model = coordinator.model
+            if (size := (model.rows, model.columns)) not in rows_by_size:
+                try:
+                    rows_by_size[size] = model.parse_vbml(vbml)
+                except Exception as ex:
+                    raise HomeAssistantError(f"Invalid VBML payload: {ex}") from ex
+            targets.append((coordinator, rows_by_size[size]))
+
+        await asyncio.gather(
+            *(
+                _async_write_message(coordinator, base_json, rows, duration)
+                for coordinator, rows in targets
+            )
+        )
+
+    async def _async_write_message(
+        coordinator: VestaboardCoordinator,
+        base_json: dict[str, str | int],
+        rows: list[list[int]],
+        duration: int | None,
+    ) -> None:
+        """Write a message to a single Vestaboard."""
+        json = base_json | {"characters": rows}
+
+        if CONF_STRATEGY not in json:
+            json.update(coordinator.default_transition_settings)
+
+        if duration:  # This is a temporary message
+            if coordinator._cancel_cb:
+                coordinator._cancel_cb()
+            expiration = dt_now() + timedelta(seconds=duration)
+            coordinator.temporary_message_expiration = expiration
+            await coordinator.write_and_update_state(json)
+            coordinator._cancel_cb = async_track_point_in_time(
+                hass, coordinator._handle_temporary_message_expiration, expiration
+            )
+        else:
+            coordinator.persistent_message = rows
+            expiration = coordinator.temporary_message_expiration
+            if not (expiration and expiration > dt_now()):
                 await coordinator.write_and_update_state(json)
-                coordinator._cancel_cb = async_track_point_in_time(
-                    hass, coordinator._handle_temporary_message_expiration, expiration
-                )
-            else:
-                coordinator.persistent_message = rows
-                expiration = coordinator.temporary_message_expiration
-                if not (expiration and expiration > dt_now()):
-                    await coordinator.write_and_update_state(json)
 
     hass.services.async_register(
         DOMAIN,
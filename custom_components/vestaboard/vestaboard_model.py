@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from collections.abc import Mapping
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Final, Self
 
+import numpy as np
+import orjson
 from pyvbml import vbml
 from pyvbml.types import IVBML, ComponentStyle
 
@@ -18,6 +23,9 @@ BIT_HEIGHT = 2 + 1 / 32
 BIT_WIDTH_SPACING = 29 / 64
 BIT_HEIGHT_SPACING = 55 / 64
 
+# Character codes are dense in [0, 71], so per-code lookups can index tuples
+CODE_COUNT = 72
+
 
 @dataclass(frozen=True)
 class ColorTheme:
@@ -25,7 +33,7 @@ class ColorTheme:
     bit: str
     text: str
     logo: str
-    color_map: dict[int, str]
+    color_map: Mapping[int, str]
 
 
 @dataclass(frozen=True)
@@ -39,24 +47,34 @@ class ModelSpec:
     emoji_map: dict[int, str] = field(default_factory=dict)
 
 
-BLACK_COLOR_MAP: Final[dict[int, str]] = {
-    0: "#141414",  # blank
-    63: "#DA291C",  # red
-    64: "#FA7400",  # orange
-    65: "#FCB81B",  # yellow
-    66: "#1F9A44",  # green
-    67: "#2083D5",  # blue
-    68: "#702F8A",  # violet
-    69: "#FFFFFF",  # white
-    70: "#141414",  # black
-    71: "#FFFFFF",  # filled
-}
-WHITE_COLOR_MAP: Final[dict[int, str]] = BLACK_COLOR_MAP | {
-    0: "#FFFFFF",  # blank
-    69: "#000000",  # black
-    70: "#FFFFFF",  # white
-    71: "#000000",  # filled
-}
+BLACK_COLOR_MAP: Final[Mapping[int, str]] = MappingProxyType(
+    {
+        0: "#141414",  # blank
+        63: "#DA291C",  # red
+        64: "#FA7400",  # orange
+        65: "#FCB81B",  # yellow
+        66: "#1F9A44",  # green
+        67: "#2083D5",  # blue
+        68: "#702F8A",  # violet
+        69: "#FFFFFF",  # white
+        70: "#141414",  # black
+        71: "#FFFFFF",  # filled
+    }
+)
+WHITE_COLOR_MAP: Final[Mapping[int, str]] = MappingProxyType(
+    {
+        0: "#FFFFFF",  # blank
+        63: "#DA291C",  # red
+        64: "#FA7400",  # orange
+        65: "#FCB81B",  # yellow
+        66: "#1F9A44",  # green
+        67: "#2083D5",  # blue
+        68: "#702F8A",  # violet
+        69: "#000000",  # black
+        70: "#FFFFFF",  # white
+        71: "#000000",  # filled
+    }
+)
 
 COLOR_SCHEMES: Final[dict[str, ColorTheme]] = {
     COLOR_BLACK: ColorTheme(
@@ -96,6 +114,57 @@ MODELS: Final[dict[str, ModelSpec]] = {
 MODEL_BY_SIZE: Final[dict[tuple[int, int], str]] = {
     (spec.rows, spec.columns): model for model, spec in MODELS.items()
 }
+_ALL_MODELS: Final = tuple(MODELS)
+_ALL_COLORS: Final = tuple(COLOR_SCHEMES)
+
+
+@dataclass(frozen=True, slots=True)
+class _Resolved:
+    """Flattened color theme and model spec for a color and model combination."""
+
+    name: str
+    bit_color: str
+    frame_color: str
+    text_color: str
+    logo_color: str
+    color_map: Mapping[int, str]
+    color_lut: tuple[str | None, ...]
+    emoji_map: dict[int, str]
+    emoji_lut: tuple[str | None, ...]
+    rows: int
+    columns: int
+    width: float
+    height: float
+    frame_border: float
+    frame_thickness: float
+    aspect_ratio: float
+    is_flagship: bool
+
+
+_RESOLVED: Final[dict[tuple[str, str], _Resolved]] = {
+    (color, model): _Resolved(
+        name=f"Vestaboard {model.capitalize()} {color.capitalize()}",
+        bit_color=theme.bit,
+        frame_color=theme.frame,
+        text_color=theme.text,
+        logo_color=theme.logo,
+        color_map=theme.color_map,
+        color_lut=tuple(map(theme.color_map.get, range(CODE_COUNT))),
+        emoji_map=spec.emoji_map,
+        emoji_lut=tuple(map(spec.emoji_map.get, range(CODE_COUNT))),
+        rows=spec.rows,
+        columns=spec.columns,
+        width=spec.width,
+        height=spec.height,
+        frame_border=spec.frame_border,
+        frame_thickness=spec.frame_thickness,
+        aspect_ratio=spec.width / spec.height,
+        is_flagship=model == MODEL_FLAGSHIP,
+    )
+    for color, theme in COLOR_SCHEMES.items()
+    for model, spec in MODELS.items()
+}
+_RESOLVED_FIELDS: Final = tuple(f.name for f in fields(_Resolved))
 
 
 @dataclass(frozen=True, slots=True)
@@ -105,95 +174,43 @@ class VestaboardModel:
     color: str
     model: str
 
+    # Derived from the color and model in __post_init__
+    name: str = field(init=False, repr=False, compare=False)
+    bit_color: str = field(init=False, repr=False, compare=False)
+    frame_color: str = field(init=False, repr=False, compare=False)
+    text_color: str = field(init=False, repr=False, compare=False)
+    logo_color: str = field(init=False, repr=False, compare=False)
+    color_map: Mapping[int, str] = field(init=False, repr=False, compare=False)
+    color_lut: tuple[str | None, ...] = field(init=False, repr=False, compare=False)
+    emoji_map: dict[int, str] = field(init=False, repr=False, compare=False)
+    emoji_lut: tuple[str | None, ...] = field(init=False, repr=False, compare=False)
+    rows: int = field(init=False, repr=False, compare=False)
+    columns: int = field(init=False, repr=False, compare=False)
+    # Physical dimensions of the board, in inches
+    width: float = field(init=False, repr=False, compare=False)
+    height: float = field(init=False, repr=False, compare=False)
+    frame_border: float = field(init=False, repr=False, compare=False)
+    frame_thickness: float = field(init=False, repr=False, compare=False)
+    aspect_ratio: float = field(init=False, repr=False, compare=False)
+    # True if this is a flagship model (6 rows x 22 columns)
+    is_flagship: bool = field(init=False, repr=False, compare=False)
+
     def __post_init__(self) -> None:
         """Validate color and model."""
-        if self.color not in COLOR_SCHEMES:
-            raise ValueError(f"Unknown color: {self.color!r}")
-        if self.model not in MODELS:
+        if (resolved := _RESOLVED.get((self.color, self.model))) is None:
+            if self.color not in COLOR_SCHEMES:
+                raise ValueError(f"Unknown color: {self.color!r}")
             raise ValueError(f"Unknown model: {self.model!r}")
-
-    @property
-    def name(self) -> str:
-        """Return the name."""
-        return f"Vestaboard {self.model.capitalize()} {self.color.capitalize()}"
-
-    @property
-    def bit_color(self) -> str:
-        """Return the bit color."""
-        return COLOR_SCHEMES[self.color].bit
-
-    @property
-    def frame_color(self) -> str:
-        """Return the frame color."""
-        return COLOR_SCHEMES[self.color].frame
-
-    @property
-    def logo_color(self) -> str:
-        """Return the logo color."""
-        return COLOR_SCHEMES[self.color].logo
-
-    @property
-    def text_color(self) -> str:
-        """Return the text color."""
-        return COLOR_SCHEMES[self.color].text
-
-    @property
-    def color_map(self) -> dict[int, str]:
-        """Return the color map."""
-        return COLOR_SCHEMES[self.color].color_map
-
-    @property
-    def emoji_map(self) -> dict[int, str]:
-        """Return the emoji map."""
-        return MODELS[self.model].emoji_map
-
-    @property
-    def rows(self) -> int:
-        """Return the number of rows."""
-        return MODELS[self.model].rows
-
-    @property
-    def columns(self) -> int:
-        """Return the number of columns."""
-        return MODELS[self.model].columns
-
-    @property
-    def width(self) -> float:
-        """Return the physical width of the board, in inches."""
-        return MODELS[self.model].width
-
-    @property
-    def height(self) -> float:
-        """Return the physical height of the board, in inches."""
-        return MODELS[self.model].height
-
-    @property
-    def frame_border(self) -> float:
-        """Return the physical frame border, in inches."""
-        return MODELS[self.model].frame_border
-
-    @property
-    def frame_thickness(self) -> float:
-        """Return the physical frame thickness, in inches."""
-        return MODELS[self.model].frame_thickness
-
-    @property
-    def aspect_ratio(self) -> float:
-        """Return the aspect ratio."""
-        return MODELS[self.model].width / MODELS[self.model].height
-
-    @property
-    def is_flagship(self) -> bool:
-        """Return True if this is a flagship model (6 rows x 22 columns)."""
-        return self.model == MODEL_FLAGSHIP
+        for name in _RESOLVED_FIELDS:
+            object.__setattr__(self, name, getattr(resolved, name))
 
     def color_for_code(self, code: int) -> str | None:
         """Return the hex color for a numeric color code, if defined."""
-        return self.color_map.get(code)
+        return self.color_lut[code] if 0 <= code < CODE_COUNT else None
 
     def emoji_for_code(self, code: int) -> str | None:
         """Return the emoji override for a given code, if defined."""
-        return self.emoji_map.get(code)
+        return self.emoji_lut[code] if 0 <= code < CODE_COUNT else None
 
     def tile_size(
         self, target_width: float, target_height: float
@@ -209,23 +226,20 @@ class VestaboardModel:
         return tile_width / tile_height
 
     @staticmethod
-    def all_models() -> list[str]:
+    def all_models() -> tuple[str, ...]:
         """Return all known Vestaboard model names."""
-        return list(MODELS.keys())
+        return _ALL_MODELS
 
     @staticmethod
-    def all_colors() -> list[str]:
+    def all_colors() -> tuple[str, ...]:
         """Return all known Vestaboard color names."""
-        return list(COLOR_SCHEMES.keys())
+        return _ALL_COLORS
 
     @classmethod
     def from_color(cls, color: str, data: list[list[int]] | None = None) -> Self:
         """Factory with validation to return Vestaboard model based on color and size."""
-        if data is None:
-            model = MODEL_FLAGSHIP
-        else:
-            size = (len(data), max((len(row) for row in data), default=0))
-            model = MODEL_BY_SIZE.get(size)
+        size = None if data is None else (len(data), max(map(len, data), default=0))
+        model = MODEL_FLAGSHIP if size is None else MODEL_BY_SIZE.get(size)
 
         if model is None or color not in COLOR_SCHEMES:
             raise ValueError(
@@ -249,4 +263,19 @@ class VestaboardModel:
         """Parse VBML using the model's size."""
         # Force array size to match this model
         data["style"] = {"height": self.rows, "width": self.columns}
-        return vbml.parse(data)
+        # Random colors must be regenerated on every parse
+        if any("randomColors" in component for component in data["components"]):
+            return vbml.parse(data)
+        rows = _parse_vbml(
+            orjson.dumps(data, default=dict, option=orjson.OPT_SORT_KEYS)
+        )
+        return rows.tolist()
+
+
+@lru_cache(maxsize=128)
+def _parse_vbml(data: bytes) -> np.ndarray:
+    """Parse serialized VBML, caching the result for identical payloads."""
+    rows = np.array(vbml.parse(orjson.loads(data)), dtype=np.int8)
+    # Cached arrays are shared between callers, so guard against mutation
+    rows.flags.writeable = False
+    return rows